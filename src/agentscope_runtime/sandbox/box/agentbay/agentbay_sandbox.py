@@ -5,9 +5,15 @@ AgentbaySandbox implementation for AgentBay cloud environment.
 This module provides a sandbox implementation that integrates with AgentBay,
 a cloud-native sandbox environment service.
 """
+import copy
 import logging
+import math
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
 
 from ...registry import SandboxRegistry
 from ...enums import SandboxType
@@ -15,6 +21,40 @@ from ..cloud.cloud_sandbox import CloudSandbox
 
 logger = logging.getLogger(__name__)
 
+# AgentBay SDK names, imported on first use by ``_load_agentbay``. The SDK
+# is heavy and reconfigures logging at import time, so importing the
+# sandbox package must not pull it in.
+AgentBay = None
+CreateSessionParams = None
+
+
+def _load_agentbay():
+    """
+    Import the AgentBay SDK once and cache its names in module globals.
+
+    Returns:
+        Tuple of the AgentBay client class and CreateSessionParams
+
+    Raises:
+        ImportError: If the SDK is not installed
+    """
+    global AgentBay, CreateSessionParams
+
+    if AgentBay is None:
+        try:
+            from agentbay import AgentBay as agentbay_cls
+            from agentbay.session_params import (
+                CreateSessionParams as params_cls,
+            )
+        except ImportError as e:
+            raise ImportError(
+                "AgentBay SDK is not installed. Please install it with: "
+                "pip install wuying-agentbay-sdk",
+            ) from e
+        AgentBay, CreateSessionParams = agentbay_cls, params_cls
+
+    return AgentBay, CreateSessionParams
+
 
 @SandboxRegistry.register(
     "agentbay-cloud",  # Virtual image name indicating cloud service
@@ -39,6 +79,58 @@ class AgentbaySandbox(CloudSandbox):
     - Tool execution in cloud environment
     """
 
+    # Tool categories are static for the class, so they are built once at
+    # import time and only copied on the way out of ``list_tools``.
+    _FILE_TOOLS = (
+        "read_file",
+        "write_file",
+        "list_directory",
+        "create_directory",
+        "move_file",
+        "delete_file",
+    )
+    _COMMAND_TOOLS = ("run_shell_command", "run_ipython_cell")
+    _BROWSER_TOOLS = ("browser_navigate", "browser_click", "browser_input")
+    _SYSTEM_TOOLS = ("screenshot",)
+    _TOOLS_BY_TYPE = MappingProxyType(
+        {
+            "file": _FILE_TOOLS,
+            "command": _COMMAND_TOOLS,
+            "browser": _BROWSER_TOOLS,
+            "system": _SYSTEM_TOOLS,
+        },
+    )
+    _ALL_TOOLS = _FILE_TOOLS + _COMMAND_TOOLS + _BROWSER_TOOLS + _SYSTEM_TOOLS
+
+    # Tool name -> handler method name, shared by all instances
+    _TOOL_HANDLERS = MappingProxyType(
+        {
+            "run_shell_command": "_execute_command",
+            "run_ipython_cell": "_execute_code",
+            "read_file": "_read_file",
+            "write_file": "_write_file",
+            "list_directory": "_list_directory",
+            "create_directory": "_create_directory",
+            "move_file": "_move_file",
+            "delete_file": "_delete_file",
+            "screenshot": "_take_screenshot",
+            "browser_navigate": "_browser_navigate",
+            "browser_click": "_browser_click",
+            "browser_input": "_browser_input",
+        },
+    )
+
+    # Read-only tools whose results are cached per path. Reads of a missing
+    # path are kept for a shorter time; other failures (API or network
+    # errors) are not cached. Any other tool may change the file system and
+    # drops the cache.
+    _CACHED_TOOLS = frozenset({"read_file", "list_directory"})
+    _READ_CACHE_SIZE = 128
+    _READ_CACHE_TTL = 10.0  # seconds
+    _NEGATIVE_CACHE_TTL = 5.0  # seconds
+    # Lower-cased fragments of the errors reported for a missing path
+    _MISSING_PATH_ERRORS = ("does not exist", "no such file", "enoent")
+
     def __init__(
         self,
         sandbox_id: Optional[str] = None,
@@ -49,6 +141,7 @@ class AgentbaySandbox(CloudSandbox):
         api_key: Optional[str] = None,
         image_id: str = "linux_latest",
         labels: Optional[Dict[str, str]] = None,
+        enable_read_cache: bool = True,
         **kwargs,
     ):
         """
@@ -63,6 +156,12 @@ class AgentbaySandbox(CloudSandbox):
             api_key: AgentBay API key (from environment or parameter)
             image_id: AgentBay image type (linux_latest, windows_latest, etc.)
             labels: Optional labels for session organization
+            enable_read_cache: Cache read_file/list_directory results
+                briefly. Changes made through this instance invalidate the
+                cache, but changes made outside it (a background command
+                still writing, or another AgentbaySandbox attached through
+                ``sandbox_id``) can be read up to 10s stale; disable for
+                consistency-sensitive workloads
             **kwargs: Additional configuration
         """
         # Get API key from parameter, environment, or bearer_token
@@ -77,6 +176,17 @@ class AgentbaySandbox(CloudSandbox):
         self.image_id = image_id
         self.labels = labels or {}
         self.base_url = base_url
+        self.enable_read_cache = enable_read_cache
+
+        # (session_id, tool_name) pairs the session reported as missing
+        self._missing_tools = set()
+        # LRU of (session_id, tool_name, path) -> (expires_at, result),
+        # shared by concurrent tool calls and guarded by its own lock
+        self._read_cache = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        # Bumped by every non-read call, so a read that missed before or
+        # during a write doesn't cache what it fetched
+        self._cache_generation = 0
 
         super().__init__(
             sandbox_id=sandbox_id,
@@ -94,21 +204,15 @@ class AgentbaySandbox(CloudSandbox):
         Returns:
             AgentBay client instance
         """
-        try:
-            # Import AgentBay SDK
-            from agentbay import AgentBay
+        agentbay_cls, _ = _load_agentbay()
 
+        try:
             # Initialize client with API key
-            client = AgentBay(api_key=self.api_key)
+            client = agentbay_cls(api_key=self.api_key)
 
             logger.info("AgentBay client initialized successfully")
             return client
 
-        except ImportError as e:
-            raise ImportError(
-                "AgentBay SDK is not installed. Please install it with: "
-                "pip install wuying-agentbay-sdk",
-            ) from e
         except Exception as e:
             raise RuntimeError(
                 f"Failed to initialize AgentBay client: {e}",
@@ -122,10 +226,12 @@ class AgentbaySandbox(CloudSandbox):
             Session ID if successful, None otherwise
         """
         try:
-            from agentbay.session_params import CreateSessionParams
+            # Load the SDK here too, in case a subclass overrides
+            # _initialize_cloud_client without importing it
+            _, params_cls = _load_agentbay()
 
             # Create session parameters
-            params = CreateSessionParams(
+            params = params_cls(
                 image_id=self.image_id,
                 labels=self.labels,
             )
@@ -188,10 +294,69 @@ class AgentbaySandbox(CloudSandbox):
             )
             return False
 
+    def _get_session(self):
+        """
+        Look up the AgentBay session backing this sandbox.
+
+        Returns:
+            AgentBay session object, or None if the session does not exist
+        """
+        get_result = self.cloud_client.get(self._sandbox_id)
+        if not get_result.success:
+            return None
+        return get_result.session
+
+    def _session_not_found(self) -> str:
+        """Build the error reported when the session does not exist."""
+        return f"Sandbox {self._sandbox_id} not found"
+
+    def call_tools(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Call several tools in the AgentBay environment, in order.
+
+        The session is looked up once for the whole batch instead of once
+        per call.
+
+        Args:
+            calls: Tool calls, each a dict with a ``name`` and optional
+                ``arguments``
+
+        Returns:
+            Tool execution results, in the same order as ``calls``
+        """
+        if not calls:
+            return []
+
+        session, error = None, None
+        try:
+            session = self._get_session()
+            if session is None:
+                error = self._session_not_found()
+        except Exception as e:
+            error = str(e)
+
+        results = []
+        for call in calls:
+            arguments = call.get("arguments") or {}
+            if error is not None:
+                results.append(
+                    self._tool_error(call["name"], arguments, error),
+                )
+            else:
+                results.append(
+                    self._call_cloud_tool(
+                        call["name"],
+                        arguments,
+                        session=session,
+                    ),
+                )
+        return results
+
     def _call_cloud_tool(
         self,
         tool_name: str,
         arguments: Dict[str, Any],
+        session=None,
     ) -> Any:
         """
         Call a tool in the AgentBay environment.
@@ -199,48 +364,148 @@ class AgentbaySandbox(CloudSandbox):
         Args:
             tool_name: Name of the tool to call
             arguments: Arguments for the tool
+            session: Already resolved AgentBay session (optional)
 
         Returns:
             Tool execution result
         """
-        try:
-            # Get the session object
-            get_result = self.cloud_client.get(self._sandbox_id)
-            if not get_result.success:
-                raise RuntimeError(f"Sandbox {self._sandbox_id} not found")
+        if (self._sandbox_id, tool_name) in self._missing_tools:
+            return self._tool_not_found(tool_name)
+
+        invalidates = tool_name not in self._CACHED_TOOLS
+        cache_key, generation = None, None
+        if invalidates:
+            self._invalidate_read_cache()
+        elif self.enable_read_cache:
+            cache_key = (self._sandbox_id, tool_name, arguments.get("path"))
+            with self._read_cache_lock:
+                generation = self._cache_generation
+            if arguments.get("cache", True):
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
 
-            session = get_result.session
-
-            # Map tool names to AgentBay session methods
-            tool_mapping = {
-                "run_shell_command": self._execute_command,
-                "run_ipython_cell": self._execute_code,
-                "read_file": self._read_file,
-                "write_file": self._write_file,
-                "list_directory": self._list_directory,
-                "create_directory": self._create_directory,
-                "move_file": self._move_file,
-                "delete_file": self._delete_file,
-                "screenshot": self._take_screenshot,
-                "browser_navigate": self._browser_navigate,
-                "browser_click": self._browser_click,
-                "browser_input": self._browser_input,
-            }
-
-            if tool_name in tool_mapping:
-                return tool_mapping[tool_name](session, arguments)
+        try:
+            if session is None:
+                session = self._get_session()
+                if session is None:
+                    return self._tool_error(
+                        tool_name,
+                        arguments,
+                        self._session_not_found(),
+                    )
+
+            handler_name = self._TOOL_HANDLERS.get(tool_name)
+            if handler_name is not None:
+                result = getattr(self, handler_name)(session, arguments)
+                if cache_key is not None:
+                    if result.get("success"):
+                        self._cache_put(
+                            cache_key,
+                            result,
+                            self._READ_CACHE_TTL,
+                            generation,
+                        )
+                    elif self._is_missing_path(result):
+                        self._cache_put(
+                            cache_key,
+                            result,
+                            self._NEGATIVE_CACHE_TTL,
+                            generation,
+                        )
+                return result
             else:
                 # Try to call as a generic method
                 return self._generic_tool_call(session, tool_name, arguments)
 
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "tool_name": tool_name,
-                "arguments": arguments,
-            }
+            return self._tool_error(tool_name, arguments, str(e))
+        finally:
+            if invalidates:
+                # Drop anything cached by reads that ran during this call
+                self._invalidate_read_cache()
+
+    @classmethod
+    def _is_missing_path(cls, result: Dict[str, Any]) -> bool:
+        """Whether a failed read reports a missing path."""
+        error = str(result.get("error") or "").lower()
+        return any(marker in error for marker in cls._MISSING_PATH_ERRORS)
+
+    @staticmethod
+    def _result_error(result) -> Optional[str]:
+        """Get the error of an SDK result (``error`` or ``error_message``)."""
+        return (
+            getattr(result, "error", None)
+            or getattr(result, "error_message", None)
+            or None
+        )
+
+    def _cache_get(self, key) -> Optional[Dict[str, Any]]:
+        """Return a copy of a live cached result, or None on a miss."""
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is None:
+                return None
+
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._read_cache[key]
+                return None
+
+            self._read_cache.move_to_end(key)
+        # Deep copy so callers can't mutate nested values (e.g. ``files``)
+        return copy.deepcopy(result)
+
+    def _cache_put(
+        self,
+        key,
+        result: Dict[str, Any],
+        ttl: float,
+        generation: int,
+    ) -> None:
+        """Cache a result, evicting the least recently used entries.
+
+        The result is dropped if a non-read call started since
+        ``generation`` was recorded, as it may predate that call.
+        """
+        entry = (time.monotonic() + ttl, copy.deepcopy(result))
+        with self._read_cache_lock:
+            if generation != self._cache_generation:
+                return
+            self._read_cache[key] = entry
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > self._READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+
+    def _invalidate_read_cache(self) -> None:
+        """Clear the read cache and discard reads still in flight."""
+        with self._read_cache_lock:
+            self._cache_generation += 1
+            self._read_cache.clear()
+
+    @staticmethod
+    def _tool_error(
+        tool_name: str,
+        arguments: Dict[str, Any],
+        error: str,
+    ) -> Dict[str, Any]:
+        """Log and build the result returned for a failed tool call."""
+        logger.error(f"Error calling tool {tool_name}: {error}")
+        return {
+            "success": False,
+            "error": error,
+            "tool_name": tool_name,
+            "arguments": arguments,
+        }
+
+    def _effective_timeout(self, timeout: float) -> float:
+        """Cap a per-call timeout (seconds) by the sandbox timeout."""
+        return min(float(timeout), self.timeout)
+
+    @staticmethod
+    def _invalid_timeout(timeout: Any) -> bool:
+        """Whether a per-call timeout is given but not positive."""
+        return timeout is not None and float(timeout) <= 0
 
     def _execute_command(
         self,
@@ -249,15 +514,27 @@ class AgentbaySandbox(CloudSandbox):
     ) -> Dict[str, Any]:
         """Execute a shell command in AgentBay."""
         command = arguments.get("command", "")
-        result = session.command.execute_command(command)
+        timeout = arguments.get("timeout")
+        if self._invalid_timeout(timeout):
+            return self._tool_error(
+                "run_shell_command",
+                arguments,
+                f"timeout must be positive, got {timeout}",
+            )
+        kwargs = {}
+        if timeout is not None:
+            # Round up so sub-second timeouts don't become 0 (no limit)
+            kwargs["timeout_ms"] = max(
+                1,
+                math.ceil(self._effective_timeout(timeout) * 1000),
+            )
+        result = session.command.execute_command(command, **kwargs)
 
         return {
             "success": result.success,
             "output": result.output,
-            "error": result.error if hasattr(result, "error") else None,
-            "exit_code": result.exit_code
-            if hasattr(result, "exit_code")
-            else 0,
+            "error": self._result_error(result),
+            "exit_code": getattr(result, "exit_code", 0),
         }
 
     def _execute_code(
@@ -267,12 +544,26 @@ class AgentbaySandbox(CloudSandbox):
     ) -> Dict[str, Any]:
         """Execute Python code in AgentBay."""
         code = arguments.get("code", "")
-        result = session.code.run_code(code, "python")
+        timeout = arguments.get("timeout")
+        if self._invalid_timeout(timeout):
+            return self._tool_error(
+                "run_ipython_cell",
+                arguments,
+                f"timeout must be positive, got {timeout}",
+            )
+        kwargs = {}
+        if timeout is not None:
+            # Round up so sub-second timeouts don't become 0 (no limit)
+            kwargs["timeout_s"] = max(
+                1,
+                math.ceil(self._effective_timeout(timeout)),
+            )
+        result = session.code.run_code(code, "python", **kwargs)
 
         return {
             "success": result.success,
             "output": result.result,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _read_file(self, session, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -282,8 +573,8 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "content": result.content if hasattr(result, "content") else None,
-            "error": result.error if hasattr(result, "error") else None,
+            "content": getattr(result, "content", None),
+            "error": self._result_error(result),
         }
 
     def _write_file(
@@ -298,7 +589,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _list_directory(
@@ -312,8 +603,8 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "files": result.files if hasattr(result, "files") else [],
-            "error": result.error if hasattr(result, "error") else None,
+            "files": getattr(result, "files", []),
+            "error": self._result_error(result),
         }
 
     def _create_directory(
@@ -327,7 +618,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _move_file(self, session, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -338,7 +629,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _delete_file(
@@ -352,7 +643,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _take_screenshot(
@@ -365,8 +656,8 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "screenshot_url": result.data if hasattr(result, "data") else None,
-            "error": result.error if hasattr(result, "error") else None,
+            "screenshot_url": getattr(result, "data", None),
+            "error": self._result_error(result),
         }
 
     def _browser_navigate(
@@ -380,7 +671,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _browser_click(
@@ -394,7 +685,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _browser_input(
@@ -409,7 +700,7 @@ class AgentbaySandbox(CloudSandbox):
 
         return {
             "success": result.success,
-            "error": result.error if hasattr(result, "error") else None,
+            "error": self._result_error(result),
         }
 
     def _generic_tool_call(
@@ -430,18 +721,22 @@ class AgentbaySandbox(CloudSandbox):
                     "result": result,
                 }
             else:
-                return {
-                    "success": False,
-                    "error": (
-                        f"Tool '{tool_name}' not found in AgentBay session"
-                    ),
-                }
+                self._missing_tools.add((self._sandbox_id, tool_name))
+                return self._tool_not_found(tool_name)
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Error calling tool '{tool_name}': {str(e)}",
             }
 
+    @staticmethod
+    def _tool_not_found(tool_name: str) -> Dict[str, Any]:
+        """Build the result returned for tools unknown to the session."""
+        return {
+            "success": False,
+            "error": f"Tool '{tool_name}' not found in AgentBay session",
+        }
+
     def _get_cloud_provider_name(self) -> str:
         """Get the name of the cloud provider."""
         return "AgentBay"
@@ -456,30 +751,9 @@ class AgentbaySandbox(CloudSandbox):
         Returns:
             Dictionary containing available tools organized by type
         """
-        # Define tool categories
-        file_tools = [
-            "read_file",
-            "write_file",
-            "list_directory",
-            "create_directory",
-            "move_file",
-            "delete_file",
-        ]
-        command_tools = ["run_shell_command", "run_ipython_cell"]
-        browser_tools = ["browser_navigate", "browser_click", "browser_input"]
-        system_tools = ["screenshot"]
-
-        # Organize tools by type
-        tools_by_type = {
-            "file": file_tools,
-            "command": command_tools,
-            "browser": browser_tools,
-            "system": system_tools,
-        }
-
         # If tool_type is specified, return only that type
         if tool_type:
-            tools = tools_by_type.get(tool_type, [])
+            tools = list(self._TOOLS_BY_TYPE.get(tool_type, ()))
             return {
                 "tools": tools,
                 "tool_type": tool_type,
@@ -488,16 +762,15 @@ class AgentbaySandbox(CloudSandbox):
             }
 
         # Return all tools organized by type
-        all_tools = []
-        for tool_list in tools_by_type.values():
-            all_tools.extend(tool_list)
-
         return {
-            "tools": all_tools,
-            "tools_by_type": tools_by_type,
+            "tools": list(self._ALL_TOOLS),
+            "tools_by_type": {
+                category: list(tools)
+                for category, tools in self._TOOLS_BY_TYPE.items()
+            },
             "tool_type": tool_type,
             "sandbox_id": self._sandbox_id,
-            "total_count": len(all_tools),
+            "total_count": len(self._ALL_TOOLS),
         }
 
     def get_session_info(self) -> Dict[str, Any]:
@@ -6,8 +6,9 @@ This module provides a base class for cloud sandbox implementations that
 don't rely on local container management but instead communicate directly
 with cloud APIs.
 """
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
 
 from ...enums import SandboxType
@@ -63,6 +64,7 @@ class CloudSandbox(Sandbox, ABC):
         # Store cloud-specific configuration
         self.cloud_config = kwargs
         self.bearer_token = bearer_token
+        self._cleaned_up = False
 
         # Initialize cloud client
         self.cloud_client = self._initialize_cloud_client()
@@ -160,6 +162,60 @@ class CloudSandbox(Sandbox, ABC):
 
         return self._call_cloud_tool(name, arguments)
 
+    def call_tools(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Call several tools in the cloud sandbox, in order.
+
+        Subclasses can override this to share per-call setup (such as
+        session lookup) across the batch; prefer it over a loop of
+        ``call_tool`` when issuing several calls back to back.
+
+        Args:
+            calls: Tool calls, each a dict with a ``name`` and optional
+                ``arguments``
+
+        Returns:
+            Tool execution results, in the same order as ``calls``
+        """
+        return [
+            self.call_tool(call["name"], call.get("arguments"))
+            for call in calls
+        ]
+
+    async def call_tool_async(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Call a tool in the cloud sandbox without blocking the event loop.
+
+        The blocking cloud API call runs in the event loop's default
+        executor.
+
+        Args:
+            name: Name of the tool to call
+            arguments: Arguments for the tool
+
+        Returns:
+            Tool execution result
+        """
+        return await asyncio.to_thread(self.call_tool, name, arguments)
+
+    async def call_tools_async(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Call several tools in the cloud sandbox, in order, off the event
+        loop.
+
+        Args:
+            calls: Tool calls, each a dict with a ``name`` and optional
+                ``arguments``
+
+        Returns:
+            Tool execution results, in the same order as ``calls``
+        """
+        return await asyncio.to_thread(self.call_tools, calls)
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get information about the cloud sandbox.
@@ -228,12 +284,17 @@ class CloudSandbox(Sandbox, ABC):
         Clean up cloud sandbox resources.
 
         This method is called when the sandbox is being destroyed.
-        It ensures that cloud resources are properly released.
+        It ensures that cloud resources are properly released. Once the
+        sandbox has been deleted, further calls are no-ops, so exiting a
+        context manager and an explicit cleanup don't delete twice.
         """
+        if self._cleaned_up:
+            return
         try:
             if self._sandbox_id:
                 success = self._delete_cloud_sandbox(self._sandbox_id)
                 if success:
+                    self._cleaned_up = True
                     logger.info(
                         f"Cloud session {self._sandbox_id} deleted "
                         f"successfully",
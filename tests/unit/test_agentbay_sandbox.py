@@ -4,151 +4,199 @@
 """
 Unit tests for AgentbaySandbox implementation.
 """
-import os
-from unittest.mock import MagicMock, patch
+import sys
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from agentscope_runtime.sandbox.box.agentbay import (
+    agentbay_sandbox as agentbay_module,
+)
 from agentscope_runtime.sandbox.box.agentbay.agentbay_sandbox import (
     AgentbaySandbox,
 )
 from agentscope_runtime.sandbox.enums import SandboxType
 
+# Module whose AgentBay SDK names the tests patch
+_MODULE = "agentscope_runtime.sandbox.box.agentbay.agentbay_sandbox"
+
 
 @pytest.fixture
 def mock_agentbay_client():
-    """Create a mock AgentBay client."""
-    client = MagicMock()
-    return client
+    """Create a mock AgentBay client.
+
+    The spec limits the mock to the client calls the sandbox makes, so a
+    typo in a test fails instead of silently creating a child mock.
+    """
+    return MagicMock(spec=["create", "get", "delete", "list"])
+
+
+_EXPECTED_FILE_TOOLS = frozenset(
+    {
+        "read_file",
+        "write_file",
+        "list_directory",
+        "create_directory",
+        "move_file",
+        "delete_file",
+    },
+)
+_EXPECTED_COMMAND_TOOLS = frozenset({"run_shell_command", "run_ipython_cell"})
+_EXPECTED_BROWSER_TOOLS = frozenset(
+    {"browser_navigate", "browser_click", "browser_input"},
+)
+_EXPECTED_SYSTEM_TOOLS = frozenset({"screenshot"})
+_EXPECTED_ALL_TOOLS = (
+    _EXPECTED_FILE_TOOLS
+    | _EXPECTED_COMMAND_TOOLS
+    | _EXPECTED_BROWSER_TOOLS
+    | _EXPECTED_SYSTEM_TOOLS
+)
+
+
+def _returns(value):
+    """Build a stub callable that always returns ``value``."""
+    return lambda *args, **kwargs: value
+
+
+_COMMAND_RESULT = SimpleNamespace(
+    success=True,
+    output="test output",
+    exit_code=0,
+)
+_CODE_RESULT = SimpleNamespace(success=True, result="test result")
+_FILE_RESULT = SimpleNamespace(
+    success=True,
+    content="file content",
+    files=["file1.txt", "file2.txt"],
+)
+_SCREENSHOT_RESULT = SimpleNamespace(success=True, data="screenshot_url")
+# SDK results report failures in ``error_message``
+_FAILED_RESULT = SimpleNamespace(
+    success=False,
+    output="",
+    result="",
+    data=None,
+    exit_code=1,
+    error_message="operation failed",
+)
+_BROWSER_RESULT = SimpleNamespace(success=True)
+_INFO_RESULT = SimpleNamespace(
+    success=True,
+    data=SimpleNamespace(
+        session_id="test-session-123",
+        resource_id="resource-123",
+        resource_url="https://test.com",
+        app_id="app-123",
+        resource_type="linux",
+    ),
+    request_id="req-123",
+)
 
 
 @pytest.fixture
 def mock_session():
-    """Create a mock AgentBay session."""
-    session = MagicMock()
-
-    # Mock command execution
-    command_result = MagicMock()
-    command_result.success = True
-    command_result.output = "test output"
-    command_result.exit_code = 0
-    session.command.execute_command.return_value = command_result
-
-    # Mock code execution
-    code_result = MagicMock()
-    code_result.success = True
-    code_result.result = "test result"
-    session.code.run_code.return_value = code_result
-
-    # Mock file system operations
-    file_result = MagicMock()
-    file_result.success = True
-    file_result.content = "file content"
-    session.file_system.read_file.return_value = file_result
-    session.file_system.write_file.return_value = file_result
-    session.file_system.list_directory.return_value = file_result
-    session.file_system.create_directory.return_value = file_result
-    session.file_system.move_file.return_value = file_result
-    session.file_system.delete_file.return_value = file_result
-    file_result.files = ["file1.txt", "file2.txt"]
-
-    # Mock computer operations
-    screenshot_result = MagicMock()
-    screenshot_result.success = True
-    screenshot_result.data = "screenshot_url"
-    session.computer.screenshot.return_value = screenshot_result
-
-    # Mock browser operations
-    browser_result = MagicMock()
-    browser_result.success = True
-    session.browser.agent.navigate.return_value = browser_result
-    session.browser.agent.click.return_value = browser_result
-    session.browser.agent.input_text.return_value = browser_result
-
-    # Mock session info
-    session.info.return_value = MagicMock(
-        success=True,
-        data=MagicMock(
-            session_id="test-session-123",
-            resource_id="resource-123",
-            resource_url="https://test.com",
-            app_id="app-123",
-            resource_type="linux",
+    """Create a stub AgentBay session.
+
+    Plain namespaces are much cheaper to build than ``MagicMock`` trees;
+    tests that assert on calls swap in a ``MagicMock`` for the one method
+    they inspect.
+    """
+    return SimpleNamespace(
+        command=SimpleNamespace(execute_command=_returns(_COMMAND_RESULT)),
+        code=SimpleNamespace(run_code=_returns(_CODE_RESULT)),
+        file_system=SimpleNamespace(
+            read_file=_returns(_FILE_RESULT),
+            write_file=_returns(_FILE_RESULT),
+            list_directory=_returns(_FILE_RESULT),
+            create_directory=_returns(_FILE_RESULT),
+            move_file=_returns(_FILE_RESULT),
+            delete_file=_returns(_FILE_RESULT),
         ),
-        request_id="req-123",
+        computer=SimpleNamespace(screenshot=_returns(_SCREENSHOT_RESULT)),
+        browser=SimpleNamespace(
+            agent=SimpleNamespace(
+                navigate=_returns(_BROWSER_RESULT),
+                click=_returns(_BROWSER_RESULT),
+                input_text=_returns(_BROWSER_RESULT),
+            ),
+        ),
+        info=_returns(_INFO_RESULT),
     )
 
-    return session
-
 
-@pytest.fixture
-def mock_create_session_result(mock_session):
+@pytest.fixture(scope="module")
+def mock_create_session_result():
     """Create a mock create session result."""
-    result = MagicMock()
-    result.success = True
-    result.session = MagicMock()
-    result.session.session_id = "test-session-123"
-    return result
+    return SimpleNamespace(
+        success=True,
+        session=SimpleNamespace(session_id="test-session-123"),
+    )
 
 
 @pytest.fixture
 def mock_get_session_result(mock_session):
     """Create a mock get session result."""
-    result = MagicMock()
-    result.success = True
-    result.session = mock_session
-    return result
+    return SimpleNamespace(success=True, session=mock_session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_delete_session_result():
     """Create a mock delete session result."""
-    result = MagicMock()
-    result.success = True
-    return result
+    return SimpleNamespace(success=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_list_sessions_result():
     """Create a mock list sessions result."""
-    result = MagicMock()
-    result.success = True
-    result.session_ids = ["session-1", "session-2"]
-    result.total_count = 2
-    result.request_id = "req-123"
-    return result
+    return SimpleNamespace(
+        success=True,
+        session_ids=["session-1", "session-2"],
+        total_count=2,
+        request_id="req-123",
+    )
 
 
 @pytest.fixture
-def agentbay_sandbox(mock_agentbay_client, mock_create_session_result):
-    """Create an AgentbaySandbox instance with mocked dependencies."""
-    with patch("agentbay.AgentBay") as mock_agentbay_class:
-        mock_agentbay_class.return_value = mock_agentbay_client
-        mock_agentbay_client.create.return_value = mock_create_session_result
+def agentbay_sdk(monkeypatch, mock_agentbay_client):
+    """Replace the AgentBay SDK names with mocks for the whole test."""
+    monkeypatch.setattr(
+        f"{_MODULE}.AgentBay",
+        MagicMock(return_value=mock_agentbay_client),
+    )
+    monkeypatch.setattr(f"{_MODULE}.CreateSessionParams", MagicMock())
 
-        sandbox = AgentbaySandbox(
-            api_key="test-api-key",
-            image_id="linux_latest",
-            labels={"test": "label"},
-        )
-        return sandbox
+
+@pytest.fixture
+def agentbay_sandbox(
+    agentbay_sdk,
+    mock_agentbay_client,
+    mock_create_session_result,
+):
+    """Create an AgentbaySandbox instance with mocked dependencies."""
+    mock_agentbay_client.create.return_value = mock_create_session_result
+    return AgentbaySandbox(
+        api_key="test-api-key",
+        image_id="linux_latest",
+        labels={"test": "label"},
+    )
 
 
 @pytest.fixture
 def agentbay_sandbox_with_existing_session(
+    agentbay_sdk,
     mock_agentbay_client,
     mock_get_session_result,
 ):
     """Create an AgentbaySandbox instance with existing session."""
-    with patch("agentbay.AgentBay") as mock_agentbay_class:
-        mock_agentbay_class.return_value = mock_agentbay_client
-        mock_agentbay_client.get.return_value = mock_get_session_result
-
-        sandbox = AgentbaySandbox(
-            sandbox_id="existing-session-123",
-            api_key="test-api-key",
-        )
-        return sandbox
+    mock_agentbay_client.get.return_value = mock_get_session_result
+    return AgentbaySandbox(
+        sandbox_id="existing-session-123",
+        api_key="test-api-key",
+    )
 
 
 class TestAgentbaySandbox:
@@ -161,46 +209,51 @@ class TestAgentbaySandbox:
         assert agentbay_sandbox.labels == {"test": "label"}
         assert agentbay_sandbox.sandbox_type == SandboxType.AGENTBAY
 
-    def test_init_with_env_var(
+    @pytest.mark.parametrize(
+        "kwargs, env, expected",
+        [
+            (
+                {"api_key": "test-api-key"},
+                {"AGENTBAY_API_KEY": "env-api-key"},
+                "test-api-key",
+            ),
+            (
+                {"image_id": "windows_latest"},
+                {"AGENTBAY_API_KEY": "env-api-key"},
+                "env-api-key",
+            ),
+            # bearer_token is deprecated but still accepted
+            ({"bearer_token": "bearer-token"}, {}, "bearer-token"),
+        ],
+        ids=["api_key", "env_var", "bearer_token"],
+    )
+    def test_init_api_key_source(
         self,
+        monkeypatch,
+        agentbay_sdk,
         mock_agentbay_client,
         mock_create_session_result,
+        kwargs,
+        env,
+        expected,
     ):
-        """Test initialization with environment variable."""
-        with patch.dict(os.environ, {"AGENTBAY_API_KEY": "env-api-key"}):
-            with patch("agentbay.AgentBay") as mock_agentbay_class:
-                mock_agentbay_class.return_value = mock_agentbay_client
-                mock_agentbay_client.create.return_value = (
-                    mock_create_session_result
-                )
+        """Test where the API key is taken from, in precedence order."""
+        monkeypatch.delenv("AGENTBAY_API_KEY", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        mock_agentbay_client.create.return_value = mock_create_session_result
 
-                sandbox = AgentbaySandbox(image_id="windows_latest")
-                assert sandbox.api_key == "env-api-key"
+        sandbox = AgentbaySandbox(**kwargs)
+        assert sandbox.api_key == expected
 
-    def test_init_without_api_key(self, mock_agentbay_client):
+    def test_init_without_api_key(self, monkeypatch, agentbay_sdk):
         """Test initialization without API key raises error."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("agentbay.AgentBay"):
-                with pytest.raises(
-                    ValueError,
-                    match="AgentBay API key is required",
-                ):
-                    AgentbaySandbox()
-
-    def test_init_with_bearer_token(
-        self,
-        mock_agentbay_client,
-        mock_create_session_result,
-    ):
-        """Test initialization with bearer_token (deprecated)."""
-        with patch("agentbay.AgentBay") as mock_agentbay_class:
-            mock_agentbay_class.return_value = mock_agentbay_client
-            mock_agentbay_client.create.return_value = (
-                mock_create_session_result
-            )
-
-            sandbox = AgentbaySandbox(bearer_token="bearer-token")
-            assert sandbox.api_key == "bearer-token"
+        monkeypatch.delenv("AGENTBAY_API_KEY", raising=False)
+        with pytest.raises(
+            ValueError,
+            match="AgentBay API key is required",
+        ):
+            AgentbaySandbox()
 
     def test_init_with_existing_session(
         self,
@@ -214,28 +267,47 @@ class TestAgentbaySandbox:
 
     def test_initialize_cloud_client_success(self):
         """Test successful cloud client initialization."""
-        with patch("agentbay.AgentBay") as mock_agentbay_class:
+        with patch(
+            f"{_MODULE}.AgentBay",
+        ) as mock_agentbay_class:
             mock_client = MagicMock()
             mock_agentbay_class.return_value = mock_client
 
             with patch(
-                "agentscope_runtime.sandbox.box.agentbay.agentbay_sandbox."
-                "AgentbaySandbox._create_cloud_sandbox",
+                f"{_MODULE}.AgentbaySandbox._create_cloud_sandbox",
                 return_value="test-session",
             ):
                 sandbox = AgentbaySandbox(api_key="test-key")
                 assert sandbox.cloud_client is not None
 
+    def test_load_agentbay_imports_once(self, monkeypatch):
+        """Test the SDK is imported on first use and then reused."""
+        sdk = SimpleNamespace(AgentBay=MagicMock())
+        params = SimpleNamespace(CreateSessionParams=MagicMock())
+        monkeypatch.setattr(f"{_MODULE}.AgentBay", None)
+        monkeypatch.setattr(f"{_MODULE}.CreateSessionParams", None)
+        monkeypatch.setitem(sys.modules, "agentbay", sdk)
+        monkeypatch.setitem(sys.modules, "agentbay.session_params", params)
+
+        expected = (sdk.AgentBay, params.CreateSessionParams)
+        assert agentbay_module._load_agentbay() == expected
+
+        # Later calls reuse the cached names instead of importing again
+        monkeypatch.setitem(sys.modules, "agentbay", None)
+        assert agentbay_module._load_agentbay() == expected
+
     def test_initialize_cloud_client_import_error(self):
         """Test cloud client initialization with import error."""
-        with patch.dict("sys.modules", {"agentbay": None}):
+        with patch(f"{_MODULE}.AgentBay", None), patch.dict(
+            sys.modules,
+            {"agentbay": None, "agentbay.session_params": None},
+        ):
             with pytest.raises(
                 ImportError,
                 match="AgentBay SDK is not installed",
             ):
                 with patch(
-                    "agentscope_runtime.sandbox.box.agentbay.agentbay_sandbox."
-                    "AgentbaySandbox._create_cloud_sandbox",
+                    f"{_MODULE}.AgentbaySandbox._create_cloud_sandbox",
                     return_value="test-session",
                 ):
                     AgentbaySandbox(api_key="test-key")
@@ -246,27 +318,63 @@ class TestAgentbaySandbox:
         mock_create_session_result,
     ):
         """Test successful cloud sandbox creation."""
-        with patch("agentbay.AgentBay") as mock_agentbay_class:
+        with patch(
+            f"{_MODULE}.AgentBay",
+        ) as mock_agentbay_class:
             mock_agentbay_class.return_value = mock_agentbay_client
             mock_agentbay_client.create.return_value = (
                 mock_create_session_result
             )
 
-            with patch("agentbay.session_params.CreateSessionParams"):
+            with patch(
+                f"{_MODULE}.CreateSessionParams",
+            ):
                 sandbox = AgentbaySandbox(api_key="test-key")
                 assert sandbox._sandbox_id == "test-session-123"
 
+    def test_create_cloud_sandbox_custom_client(
+        self,
+        monkeypatch,
+        mock_agentbay_client,
+        mock_create_session_result,
+    ):
+        """Test creation loads the SDK when the client is built elsewhere."""
+        params = SimpleNamespace(CreateSessionParams=MagicMock())
+        monkeypatch.setattr(f"{_MODULE}.AgentBay", None)
+        monkeypatch.setattr(f"{_MODULE}.CreateSessionParams", None)
+        monkeypatch.setitem(
+            sys.modules,
+            "agentbay",
+            SimpleNamespace(AgentBay=MagicMock()),
+        )
+        monkeypatch.setitem(sys.modules, "agentbay.session_params", params)
+        mock_agentbay_client.create.return_value = mock_create_session_result
+
+        class CustomClientSandbox(AgentbaySandbox):
+            def _initialize_cloud_client(self):
+                return mock_agentbay_client
+
+        sandbox = CustomClientSandbox(api_key="test-key")
+
+        assert sandbox._sandbox_id == "test-session-123"
+        params.CreateSessionParams.assert_called_once()
+
     def test_create_cloud_sandbox_failure(self, mock_agentbay_client):
         """Test cloud sandbox creation failure."""
-        failed_result = MagicMock()
-        failed_result.success = False
-        failed_result.error_message = "Creation failed"
+        failed_result = SimpleNamespace(
+            success=False,
+            error_message="Creation failed",
+        )
 
-        with patch("agentbay.AgentBay") as mock_agentbay_class:
+        with patch(
+            f"{_MODULE}.AgentBay",
+        ) as mock_agentbay_class:
             mock_agentbay_class.return_value = mock_agentbay_client
             mock_agentbay_client.create.return_value = failed_result
 
-            with patch("agentbay.session_params.CreateSessionParams"):
+            with patch(
+                f"{_MODULE}.CreateSessionParams",
+            ):
                 sandbox = AgentbaySandbox(
                     api_key="test-key",
                     sandbox_id="existing",
@@ -294,8 +402,7 @@ class TestAgentbaySandbox:
 
     def test_delete_cloud_sandbox_not_found(self, agentbay_sandbox):
         """Test deleting non-existent sandbox."""
-        not_found_result = MagicMock()
-        not_found_result.success = False
+        not_found_result = SimpleNamespace(success=False)
 
         agentbay_sandbox.cloud_client.get.return_value = not_found_result
 
@@ -308,9 +415,10 @@ class TestAgentbaySandbox:
         mock_get_session_result,
     ):
         """Test cloud sandbox deletion failure."""
-        failed_result = MagicMock()
-        failed_result.success = False
-        failed_result.error_message = "Deletion failed"
+        failed_result = SimpleNamespace(
+            success=False,
+            error_message="Deletion failed",
+        )
 
         agentbay_sandbox.cloud_client.get.return_value = (
             mock_get_session_result
@@ -326,7 +434,7 @@ class TestAgentbaySandbox:
         with patch.object(
             agentbay_sandbox.cloud_client,
             "get",
-            return_value=MagicMock(success=True, session=mock_session),
+            return_value=SimpleNamespace(success=True, session=mock_session),
         ):
             result = agentbay_sandbox._execute_command(
                 mock_session,
@@ -345,86 +453,178 @@ class TestAgentbaySandbox:
         assert result["success"] is True
         assert result["output"] == "test result"
 
-    def test_read_file(self, agentbay_sandbox, mock_session):
-        """Test reading a file."""
-        result = agentbay_sandbox._read_file(
+    def test_execute_with_timeout(self, agentbay_sandbox, mock_session):
+        """Test per-call timeouts reach the SDK, capped by the sandbox."""
+        agentbay_sandbox.timeout = 60
+        mock_session.command.execute_command = MagicMock(
+            return_value=_COMMAND_RESULT,
+        )
+        mock_session.code.run_code = MagicMock(return_value=_CODE_RESULT)
+
+        agentbay_sandbox._execute_command(
             mock_session,
-            {"path": "/test.txt"},
+            {"command": "sleep 1", "timeout": 5},
+        )
+        mock_session.command.execute_command.assert_called_with(
+            "sleep 1",
+            timeout_ms=5000,
         )
-        assert result["success"] is True
-        assert result["content"] == "file content"
 
-    def test_write_file(self, agentbay_sandbox, mock_session):
-        """Test writing a file."""
-        result = agentbay_sandbox._write_file(
+        agentbay_sandbox._execute_code(
             mock_session,
-            {"path": "/test.txt", "content": "test"},
+            {"code": "pass", "timeout": 600},
+        )
+        mock_session.code.run_code.assert_called_with(
+            "pass",
+            "python",
+            timeout_s=60,
         )
-        assert result["success"] is True
 
-    def test_list_directory(self, agentbay_sandbox, mock_session):
-        """Test listing directory contents."""
-        result = agentbay_sandbox._list_directory(
+    def test_execute_with_sub_second_timeout(
+        self,
+        agentbay_sandbox,
+        mock_session,
+    ):
+        """Test sub-second timeouts round up instead of dropping to 0."""
+        mock_session.command.execute_command = MagicMock(
+            return_value=_COMMAND_RESULT,
+        )
+        mock_session.code.run_code = MagicMock(return_value=_CODE_RESULT)
+
+        agentbay_sandbox._execute_command(
             mock_session,
-            {"path": "/tmp"},
+            {"command": "true", "timeout": 0.0005},
+        )
+        mock_session.command.execute_command.assert_called_with(
+            "true",
+            timeout_ms=1,
         )
-        assert result["success"] is True
-        assert "file1.txt" in result["files"]
-        assert "file2.txt" in result["files"]
 
-    def test_create_directory(self, agentbay_sandbox, mock_session):
-        """Test creating a directory."""
-        result = agentbay_sandbox._create_directory(
+        agentbay_sandbox._execute_code(
             mock_session,
-            {"path": "/newdir"},
+            {"code": "pass", "timeout": 0.5},
+        )
+        mock_session.code.run_code.assert_called_with(
+            "pass",
+            "python",
+            timeout_s=1,
         )
-        assert result["success"] is True
 
-    def test_move_file(self, agentbay_sandbox, mock_session):
-        """Test moving a file."""
-        result = agentbay_sandbox._move_file(
+    @pytest.mark.parametrize("timeout", [0, -1])
+    @pytest.mark.parametrize(
+        "method, arguments",
+        [
+            ("_execute_command", {"command": "true"}),
+            ("_execute_code", {"code": "pass"}),
+        ],
+    )
+    def test_execute_with_invalid_timeout(
+        self,
+        agentbay_sandbox,
+        mock_session,
+        method,
+        arguments,
+        timeout,
+    ):
+        """Test non-positive timeouts are rejected without a call."""
+        mock_session.command.execute_command = MagicMock()
+        mock_session.code.run_code = MagicMock()
+
+        result = getattr(agentbay_sandbox, method)(
             mock_session,
-            {"source": "/src.txt", "destination": "/dst.txt"},
+            {**arguments, "timeout": timeout},
         )
-        assert result["success"] is True
 
-    def test_delete_file(self, agentbay_sandbox, mock_session):
-        """Test deleting a file."""
-        result = agentbay_sandbox._delete_file(
+        assert result["success"] is False
+        assert "timeout must be positive" in result["error"]
+        mock_session.command.execute_command.assert_not_called()
+        mock_session.code.run_code.assert_not_called()
+
+    def test_read_file(self, agentbay_sandbox, mock_session):
+        """Test reading a file."""
+        result = agentbay_sandbox._read_file(
             mock_session,
             {"path": "/test.txt"},
         )
         assert result["success"] is True
+        assert result["content"] == "file content"
 
-    def test_take_screenshot(self, agentbay_sandbox, mock_session):
-        """Test taking a screenshot."""
-        result = agentbay_sandbox._take_screenshot(mock_session, {})
+    @pytest.mark.parametrize(
+        "method, arguments",
+        [
+            ("_write_file", {"path": "/test.txt", "content": "test"}),
+            ("_create_directory", {"path": "/newdir"}),
+            ("_move_file", {"source": "/src.txt", "destination": "/dst.txt"}),
+            ("_delete_file", {"path": "/test.txt"}),
+            ("_browser_navigate", {"url": "https://example.com"}),
+            ("_browser_click", {"selector": "#button"}),
+            ("_browser_input", {"selector": "#input", "text": "test"}),
+        ],
+    )
+    def test_operation_success(
+        self,
+        agentbay_sandbox,
+        mock_session,
+        method,
+        arguments,
+    ):
+        """Test file and browser operations that only report success."""
+        result = getattr(agentbay_sandbox, method)(mock_session, arguments)
         assert result["success"] is True
-        assert result["screenshot_url"] == "screenshot_url"
 
-    def test_browser_navigate(self, agentbay_sandbox, mock_session):
-        """Test browser navigation."""
-        result = agentbay_sandbox._browser_navigate(
-            mock_session,
-            {"url": "https://example.com"},
-        )
-        assert result["success"] is True
+    @pytest.mark.parametrize(
+        "method, arguments",
+        [
+            ("_execute_command", {"command": "false"}),
+            ("_execute_code", {"code": "raise ValueError"}),
+            ("_read_file", {"path": "/test.txt"}),
+            ("_write_file", {"path": "/test.txt", "content": "test"}),
+            ("_list_directory", {"path": "/tmp"}),
+            ("_create_directory", {"path": "/newdir"}),
+            ("_move_file", {"source": "/src.txt", "destination": "/dst.txt"}),
+            ("_delete_file", {"path": "/test.txt"}),
+            ("_take_screenshot", {}),
+            ("_browser_navigate", {"url": "https://example.com"}),
+            ("_browser_click", {"selector": "#button"}),
+            ("_browser_input", {"selector": "#input", "text": "test"}),
+        ],
+    )
+    def test_operation_failure(
+        self,
+        agentbay_sandbox,
+        mock_session,
+        method,
+        arguments,
+    ):
+        """Test every handler reports the SDK's ``error_message``."""
+        namespaces = [mock_session]
+        while namespaces:
+            namespace = namespaces.pop()
+            for name, value in list(vars(namespace).items()):
+                if isinstance(value, SimpleNamespace):
+                    namespaces.append(value)
+                else:
+                    setattr(namespace, name, _returns(_FAILED_RESULT))
+
+        result = getattr(agentbay_sandbox, method)(mock_session, arguments)
+        assert result["success"] is False
+        assert result["error"] == "operation failed"
 
-    def test_browser_click(self, agentbay_sandbox, mock_session):
-        """Test browser click."""
-        result = agentbay_sandbox._browser_click(
+    def test_list_directory(self, agentbay_sandbox, mock_session):
+        """Test listing directory contents."""
+        result = agentbay_sandbox._list_directory(
             mock_session,
-            {"selector": "#button"},
+            {"path": "/tmp"},
         )
         assert result["success"] is True
+        assert "file1.txt" in result["files"]
+        assert "file2.txt" in result["files"]
 
-    def test_browser_input(self, agentbay_sandbox, mock_session):
-        """Test browser input."""
-        result = agentbay_sandbox._browser_input(
-            mock_session,
-            {"selector": "#input", "text": "test"},
-        )
+    def test_take_screenshot(self, agentbay_sandbox, mock_session):
+        """Test taking a screenshot."""
+        result = agentbay_sandbox._take_screenshot(mock_session, {})
         assert result["success"] is True
+        assert result["screenshot_url"] == "screenshot_url"
 
     def test_call_cloud_tool_success(
         self,
@@ -445,8 +645,7 @@ class TestAgentbaySandbox:
 
     def test_call_cloud_tool_sandbox_not_found(self, agentbay_sandbox):
         """Test calling a tool when sandbox is not found."""
-        not_found_result = MagicMock()
-        not_found_result.success = False
+        not_found_result = SimpleNamespace(success=False)
 
         agentbay_sandbox._sandbox_id = "test-session"
         agentbay_sandbox.cloud_client.get.return_value = not_found_result
@@ -458,6 +657,51 @@ class TestAgentbaySandbox:
         assert result["success"] is False
         assert "Sandbox test-session not found" in result["error"]
 
+    def test_call_tools_single_session_lookup(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test a batch of tool calls looks the session up only once."""
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        results = agentbay_sandbox.call_tools(
+            [
+                {"name": "run_shell_command", "arguments": {"command": "ls"}},
+                {"name": "read_file", "arguments": {"path": "/test.txt"}},
+            ],
+        )
+        assert results[0]["output"] == "test output"
+        assert results[1]["content"] == "file content"
+        agentbay_sandbox.cloud_client.get.assert_called_once_with(
+            "test-session",
+        )
+
+    def test_call_tools_sandbox_not_found(self, agentbay_sandbox):
+        """Test every call in a batch fails when the session is missing."""
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = SimpleNamespace(
+            success=False,
+        )
+
+        results = agentbay_sandbox.call_tools(
+            [{"name": "run_shell_command"}, {"name": "read_file"}],
+        )
+        assert [r["success"] for r in results] == [False, False]
+        assert "Sandbox test-session not found" in results[1]["error"]
+        assert results[0] == agentbay_sandbox._call_cloud_tool(
+            "run_shell_command",
+            {},
+        )
+
+    def test_call_tools_empty(self, agentbay_sandbox):
+        """Test an empty batch skips the session lookup."""
+        assert agentbay_sandbox.call_tools([]) == []
+        agentbay_sandbox.cloud_client.get.assert_not_called()
+
     def test_call_cloud_tool_generic(
         self,
         agentbay_sandbox,
@@ -488,8 +732,6 @@ class TestAgentbaySandbox:
         # Configure session to not have the attribute
         mock_session = mock_get_session_result.session
         # Use spec to limit available attributes
-        from unittest.mock import Mock
-
         mock_session = Mock(spec=[])  # Empty spec means no attributes
         mock_get_session_result.session = mock_session
 
@@ -505,6 +747,301 @@ class TestAgentbaySandbox:
         assert result["success"] is False
         assert "not found in AgentBay session" in result["error"]
 
+    def test_call_cloud_tool_not_found_is_cached(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test repeated calls to a missing tool skip the session lookup."""
+        mock_get_session_result.session = Mock(spec=[])
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        first = agentbay_sandbox._call_cloud_tool("non_existent_tool", {})
+        second = agentbay_sandbox._call_cloud_tool("non_existent_tool", {})
+
+        assert first == second
+        assert second["success"] is False
+        agentbay_sandbox.cloud_client.get.assert_called_once_with(
+            "test-session",
+        )
+
+        # A different session must look the tool up again
+        agentbay_sandbox._sandbox_id = "other-session"
+        agentbay_sandbox._call_cloud_tool("non_existent_tool", {})
+        assert agentbay_sandbox.cloud_client.get.call_count == 2
+
+    def test_call_cloud_tool_read_cache(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test repeated reads are served from the read cache."""
+        read_file = MagicMock(return_value=_FILE_RESULT)
+        mock_get_session_result.session.file_system.read_file = read_file
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        first = agentbay_sandbox._call_cloud_tool(
+            "read_file",
+            {"path": "/test.txt"},
+        )
+        second = agentbay_sandbox._call_cloud_tool(
+            "read_file",
+            {"path": "/test.txt"},
+        )
+        assert first == second
+        assert second["content"] == "file content"
+        assert read_file.call_count == 1
+
+        # Bypassing the cache always reaches the session
+        agentbay_sandbox._call_cloud_tool(
+            "read_file",
+            {"path": "/test.txt", "cache": False},
+        )
+        assert read_file.call_count == 2
+
+        # Any other tool may change the file system and drops the cache
+        agentbay_sandbox._call_cloud_tool(
+            "write_file",
+            {"path": "/test.txt", "content": "new"},
+        )
+        agentbay_sandbox._call_cloud_tool("read_file", {"path": "/test.txt"})
+        assert read_file.call_count == 3
+
+    def test_call_cloud_tool_read_cache_copies(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test callers can't mutate cached results through nested lists."""
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        first = agentbay_sandbox._call_cloud_tool(
+            "list_directory",
+            {"path": "/tmp"},
+        )
+        first["files"].append("injected.txt")
+        second = agentbay_sandbox._call_cloud_tool(
+            "list_directory",
+            {"path": "/tmp"},
+        )
+        second["files"].clear()
+        third = agentbay_sandbox._call_cloud_tool(
+            "list_directory",
+            {"path": "/tmp"},
+        )
+        assert third["files"] == ["file1.txt", "file2.txt"]
+
+    def test_call_cloud_tool_read_cache_concurrent_write(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test a write racing a cached read can't break the read."""
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+        agentbay_sandbox._call_cloud_tool("read_file", {"path": "/a"})
+        writer_started = threading.Event()
+        writers = []
+
+        def write():
+            writer_started.set()
+            agentbay_sandbox._call_cloud_tool(
+                "write_file",
+                {"path": "/a", "content": "x"},
+            )
+
+        class InterleavingCache(OrderedDict):
+            """Start a write from another thread in the middle of a lookup."""
+
+            def get(self, key, default=None):
+                entry = super().get(key, default)
+                if not writers:
+                    writer = threading.Thread(target=write)
+                    writers.append(writer)
+                    writer.start()
+                    writer_started.wait()
+                return entry
+
+        agentbay_sandbox._read_cache = InterleavingCache(
+            agentbay_sandbox._read_cache,
+        )
+        result = agentbay_sandbox._call_cloud_tool("read_file", {"path": "/a"})
+        writers[0].join()
+
+        assert result["content"] == "file content"
+        assert not agentbay_sandbox._read_cache
+
+    def test_call_cloud_tool_read_cache_write_during_miss(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test a read that missed before a write doesn't cache old data."""
+        contents = {"/a": "old content"}
+        read_started = threading.Event()
+        write_done = threading.Event()
+
+        def read_file(path):
+            content = contents[path]
+            if not read_started.is_set():
+                read_started.set()
+                write_done.wait()
+            return SimpleNamespace(success=True, content=content)
+
+        def write_file(path, content):
+            contents[path] = content
+            return SimpleNamespace(success=True)
+
+        file_system = mock_get_session_result.session.file_system
+        file_system.read_file = read_file
+        file_system.write_file = write_file
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+        results = []
+        reader = threading.Thread(
+            target=lambda: results.append(
+                agentbay_sandbox._call_cloud_tool("read_file", {"path": "/a"}),
+            ),
+        )
+        reader.start()
+        read_started.wait()
+        agentbay_sandbox._call_cloud_tool(
+            "write_file",
+            {"path": "/a", "content": "new content"},
+        )
+        write_done.set()
+        reader.join()
+
+        assert results[0]["content"] == "old content"
+        assert not agentbay_sandbox._read_cache
+        result = agentbay_sandbox._call_cloud_tool("read_file", {"path": "/a"})
+        assert result["content"] == "new content"
+
+    def test_call_cloud_tool_read_cache_expires(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test cached reads expire after the cache TTL."""
+        list_directory = MagicMock(return_value=_FILE_RESULT)
+        file_system = mock_get_session_result.session.file_system
+        file_system.list_directory = list_directory
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        with patch(
+            f"{_MODULE}.time.monotonic",
+            side_effect=[0.0, 1.0, 100.0, 100.0],
+        ):
+            for _ in range(3):
+                agentbay_sandbox._call_cloud_tool(
+                    "list_directory",
+                    {"path": "/tmp"},
+                )
+        assert list_directory.call_count == 2
+
+    def test_call_cloud_tool_read_cache_negative(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test missing-path reads are cached for the shorter TTL."""
+        read_file = MagicMock(
+            return_value=SimpleNamespace(
+                success=False,
+                content="",
+                error_message="Path does not exist or is a directory: "
+                "/missing.txt",
+            ),
+        )
+        mock_get_session_result.session.file_system.read_file = read_file
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        with patch(
+            f"{_MODULE}.time.monotonic",
+            side_effect=[0.0, 4.0, 6.0, 6.0],
+        ):
+            for _ in range(3):
+                result = agentbay_sandbox._call_cloud_tool(
+                    "read_file",
+                    {"path": "/missing.txt"},
+                )
+                assert result["success"] is False
+        assert read_file.call_count == 2
+
+    def test_call_cloud_tool_read_cache_transient_error(
+        self,
+        agentbay_sandbox,
+        mock_get_session_result,
+    ):
+        """Test reads failing for other reasons are not cached."""
+        read_file = MagicMock(
+            return_value=SimpleNamespace(
+                success=False,
+                content="",
+                error_message="Failed to get file info: timed out",
+            ),
+        )
+        mock_get_session_result.session.file_system.read_file = read_file
+
+        agentbay_sandbox._sandbox_id = "test-session"
+        agentbay_sandbox.cloud_client.get.return_value = (
+            mock_get_session_result
+        )
+
+        for _ in range(2):
+            result = agentbay_sandbox._call_cloud_tool(
+                "read_file",
+                {"path": "/test.txt"},
+            )
+            assert result["error"] == "Failed to get file info: timed out"
+        assert read_file.call_count == 2
+
+    def test_call_cloud_tool_read_cache_disabled(
+        self,
+        agentbay_sdk,
+        mock_agentbay_client,
+        mock_create_session_result,
+        mock_get_session_result,
+    ):
+        """Test reads always reach the session when caching is disabled."""
+        mock_agentbay_client.create.return_value = mock_create_session_result
+        sandbox = AgentbaySandbox(
+            api_key="test-api-key",
+            enable_read_cache=False,
+        )
+
+        read_file = MagicMock(return_value=_FILE_RESULT)
+        mock_get_session_result.session.file_system.read_file = read_file
+
+        sandbox.cloud_client.get.return_value = mock_get_session_result
+        for _ in range(2):
+            sandbox._call_cloud_tool("read_file", {"path": "/test.txt"})
+        assert read_file.call_count == 2
+
     def test_get_session_info_success(
         self,
         agentbay_sandbox,
@@ -523,8 +1060,7 @@ class TestAgentbaySandbox:
 
     def test_get_session_info_not_found(self, agentbay_sandbox):
         """Test getting session info when session not found."""
-        not_found_result = MagicMock()
-        not_found_result.success = False
+        not_found_result = SimpleNamespace(success=False)
 
         agentbay_sandbox._sandbox_id = "test-session"
         agentbay_sandbox.cloud_client.get.return_value = not_found_result
@@ -581,46 +1117,37 @@ class TestAgentbaySandbox:
     def test_list_tools_all(self, agentbay_sandbox):
         """Test listing all tools."""
         result = agentbay_sandbox.list_tools()
-        assert "tools" in result
-        assert "tools_by_type" in result
-        assert "total_count" in result
+        assert frozenset(result["tools"]) == _EXPECTED_ALL_TOOLS
         assert result["total_count"] == 12  # All tools
-        assert "run_shell_command" in result["tools"]
-        assert "read_file" in result["tools"]
-        assert "browser_navigate" in result["tools"]
-
-    def test_list_tools_by_type_file(self, agentbay_sandbox):
-        """Test listing file tools."""
-        result = agentbay_sandbox.list_tools(tool_type="file")
-        assert result["tool_type"] == "file"
-        assert "read_file" in result["tools"]
-        assert "write_file" in result["tools"]
-        assert "list_directory" in result["tools"]
-        assert result["total_count"] == 6  # File tools
-
-    def test_list_tools_by_type_command(self, agentbay_sandbox):
-        """Test listing command tools."""
-        result = agentbay_sandbox.list_tools(tool_type="command")
-        assert result["tool_type"] == "command"
-        assert "run_shell_command" in result["tools"]
-        assert "run_ipython_cell" in result["tools"]
-        assert result["total_count"] == 2  # Command tools
-
-    def test_list_tools_by_type_browser(self, agentbay_sandbox):
-        """Test listing browser tools."""
-        result = agentbay_sandbox.list_tools(tool_type="browser")
-        assert result["tool_type"] == "browser"
-        assert "browser_navigate" in result["tools"]
-        assert "browser_click" in result["tools"]
-        assert "browser_input" in result["tools"]
-        assert result["total_count"] == 3  # Browser tools
-
-    def test_list_tools_by_type_system(self, agentbay_sandbox):
-        """Test listing system tools."""
-        result = agentbay_sandbox.list_tools(tool_type="system")
-        assert result["tool_type"] == "system"
-        assert "screenshot" in result["tools"]
-        assert result["total_count"] == 1  # System tools
+        # Every listed tool must have a dedicated handler
+        assert frozenset(agentbay_sandbox._TOOL_HANDLERS) == (
+            _EXPECTED_ALL_TOOLS
+        )
+        assert {
+            tool_type: frozenset(tools)
+            for tool_type, tools in result["tools_by_type"].items()
+        } == {
+            "file": _EXPECTED_FILE_TOOLS,
+            "command": _EXPECTED_COMMAND_TOOLS,
+            "browser": _EXPECTED_BROWSER_TOOLS,
+            "system": _EXPECTED_SYSTEM_TOOLS,
+        }
+
+    @pytest.mark.parametrize(
+        "tool_type, expected",
+        [
+            ("file", _EXPECTED_FILE_TOOLS),
+            ("command", _EXPECTED_COMMAND_TOOLS),
+            ("browser", _EXPECTED_BROWSER_TOOLS),
+            ("system", _EXPECTED_SYSTEM_TOOLS),
+        ],
+    )
+    def test_list_tools_by_type(self, agentbay_sandbox, tool_type, expected):
+        """Test listing the tools of a single type."""
+        result = agentbay_sandbox.list_tools(tool_type=tool_type)
+        assert result["tool_type"] == tool_type
+        assert frozenset(result["tools"]) == expected
+        assert result["total_count"] == len(expected)
 
     def test_list_tools_unknown_type(self, agentbay_sandbox):
         """Test listing tools with unknown type."""
@@ -127,6 +127,32 @@ class TestCloudSandbox:
         result = mock_cloud_sandbox.call_tool("test_tool", None)
         assert result["success"] is True
 
+    def test_call_tools(self, mock_cloud_sandbox):
+        """Test calling several tools keeps the call order."""
+        with patch.object(
+            mock_cloud_sandbox,
+            "_call_cloud_tool",
+            side_effect=lambda name, arguments: (name, arguments),
+        ):
+            results = mock_cloud_sandbox.call_tools(
+                [
+                    {"name": "first", "arguments": {"a": 1}},
+                    {"name": "second"},
+                ],
+            )
+        assert results == [("first", {"a": 1}), ("second", {})]
+
+    @pytest.mark.asyncio
+    async def test_call_tool_async(self, mock_cloud_sandbox):
+        """Test the async tool call wrappers."""
+        result = await mock_cloud_sandbox.call_tool_async("test_tool")
+        assert result["success"] is True
+
+        results = await mock_cloud_sandbox.call_tools_async(
+            [{"name": "first"}, {"name": "second"}],
+        )
+        assert [r["result"] for r in results] == ["mock_result"] * 2
+
     def test_get_info(self, mock_cloud_sandbox):
         """Test getting sandbox information."""
         info = mock_cloud_sandbox.get_info()
@@ -181,6 +207,29 @@ class TestCloudSandbox:
             mock_cloud_sandbox._cleanup()
             mock_delete.assert_called_once_with("test-sandbox-123")
 
+    def test_cleanup_is_idempotent(self, mock_cloud_sandbox):
+        """Test repeated cleanup deletes the sandbox only once."""
+        with patch.object(
+            mock_cloud_sandbox,
+            "_delete_cloud_sandbox",
+            return_value=True,
+        ) as mock_delete:
+            with mock_cloud_sandbox:
+                pass
+            mock_cloud_sandbox._cleanup()
+            mock_delete.assert_called_once_with("test-sandbox-123")
+
+    def test_cleanup_retries_after_failure(self, mock_cloud_sandbox):
+        """Test cleanup retries when a previous deletion failed."""
+        with patch.object(
+            mock_cloud_sandbox,
+            "_delete_cloud_sandbox",
+            side_effect=[False, True],
+        ) as mock_delete:
+            mock_cloud_sandbox._cleanup()
+            mock_cloud_sandbox._cleanup()
+            assert mock_delete.call_count == 2
+
     def test_cleanup_failure(self, mock_cloud_sandbox):
         """Test cleanup with failed deletion."""
         with patch.object(